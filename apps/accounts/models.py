@@ -1,5 +1,6 @@
 from django.contrib.auth.models import AbstractUser
-from ..base.model_fields import TimeZoneField
+
+from apps.base.model_fields import TimeZoneField
 
 
 class User(AbstractUser):
@@ -1,16 +1,25 @@
-import zoneinfo
+import functools
 
 from django.db import models
 from django.utils import timezone
 
+from apps.base.timezone_names import TIMEZONE_NAMES
 
+
+@functools.lru_cache(maxsize=1)
 def get_valid_timezones():
-    return sorted([(tz, tz) for tz in zoneinfo.available_timezones()])
+    return tuple((tz, tz) for tz in TIMEZONE_NAMES)
 
 
 class TimeZoneField(models.CharField):
     def __init__(self, *args, **kwargs):
-        kwargs.setdefault("max_length", 100)
-        kwargs.setdefault("choices", get_valid_timezones())
-        kwargs.setdefault("default", timezone.get_current_timezone_name())
+        kwargs.setdefault("max_length", 64)
+        kwargs.setdefault("choices", get_valid_timezones)
+        kwargs.setdefault("default", timezone.get_default_timezone_name)
         super().__init__(*args, **kwargs)
+
+    def formfield(self, **kwargs):
+        # A callable default makes Django render a hidden "initial-" input for the field, which isn't needed since the
+        # default timezone doesn't change between requests
+        kwargs.setdefault("show_hidden_initial", False)
+        return super().formfield(**kwargs)
@@ -1,10 +1,17 @@
 import zoneinfo
 
+from django.contrib.auth import get_user_model
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.http import JsonResponse
 from django.views import View
 from django.views.generic import TemplateView
 
+from apps.base.timezone_names import TIMEZONE_NAMES
+
+# Only accept timezones that are valid choices for `TimeZoneField` and that the runtime can load. This is built once at
+# import time, since `available_timezones()` scans the tz database on every call.
+VALID_TIMEZONES = frozenset(TIMEZONE_NAMES) & zoneinfo.available_timezones()
+
 
 class IndexView(LoginRequiredMixin, TemplateView):
     template_name = "index.html"
@@ -20,14 +27,14 @@ class UpdateTimezoneView(LoginRequiredMixin, View):
         timezone = request.POST.get("timezone")
 
         # Validate the timezone
-        if timezone not in zoneinfo.available_timezones():
+        if timezone not in VALID_TIMEZONES:
             return JsonResponse(
                 {"status": "error", "message": "Invalid timezone"}, status=400
             )
 
-        # Update user's timezone
+        # Update user's timezone with a single UPDATE query, then keep the in-memory user in sync
+        get_user_model().objects.filter(pk=request.user.pk).update(timezone=timezone)
         request.user.timezone = timezone
-        request.user.save(update_fields=["timezone"])
 
         return JsonResponse(
             {"status": "success", "message": "Timezone updated successfully"}
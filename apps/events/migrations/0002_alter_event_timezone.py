@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-15 08:10
+
+import apps.base.model_fields
+import django.utils.timezone
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("events", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="event",
+            name="timezone",
+            field=apps.base.model_fields.TimeZoneField(
+                choices=apps.base.model_fields.get_valid_timezones,
+                default=django.utils.timezone.get_default_timezone_name,
+                max_length=64,
+            ),
+        ),
+    ]
@@ -15,8 +15,12 @@ class Event(models.Model):
     def __str__(self):
         return self.name
 
+    @property
+    def tzinfo(self):
+        return ZoneInfo(self.timezone)
+
     def display_start_time(self):
-        return timezone.make_naive(self.start_time, ZoneInfo(self.timezone))
+        return timezone.make_naive(self.start_time, self.tzinfo)
 
     def display_end_time(self):
-        return timezone.make_naive(self.end_time, ZoneInfo(self.timezone))
+        return timezone.make_naive(self.end_time, self.tzinfo)
@@ -14,10 +14,12 @@ The --github-url parameter enables links to the original test files in the READM
 
 import re
 import ast
+import functools
 from pathlib import Path
-import subprocess
-import tempfile
 import os
+import shutil
+import subprocess
+import textwrap
 import argparse
 
 # Define the root directory of the project
@@ -25,11 +27,31 @@ ROOT_DIR = Path(__file__).parent.parent
 TESTS_DIR = ROOT_DIR / "tests"
 README_PATH = ROOT_DIR / "README.md"
 
+# Resolve ruff once, preferring the project's virtualenv (so the locked version is used) over the PATH
+RUFF_BIN = (
+    shutil.which(
+        "ruff",
+        path=os.pathsep.join(
+            [str(ROOT_DIR / ".venv" / "bin"), os.environ.get("PATH", os.defpath)]
+        ),
+    )
+    or "ruff"
+)
+
 # Configuration options
 # Default GitHub repository URL (without trailing slash)
 # Set to None to disable GitHub links by default
 DEFAULT_GITHUB_REPO_URL = None
 
+# Comment used to separate the code examples when they're formatted together
+EXAMPLE_SEPARATOR = "# --- update_readme.py example separator ---"
+
+# Regular expressions used to clean up the examples and build the table of contents
+RENDER_STR_TEMPLATE_PATTERN = re.compile(r"self\.render_str_template\((.*?), (.*?)\)")
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#{1,6})?$", re.MULTILINE)
+ANCHOR_INVALID_CHARS_PATTERN = re.compile(r"[^\w\- ]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 # Parse command-line arguments
 def parse_args():
@@ -44,12 +66,24 @@ def parse_args():
     return parser.parse_args()
 
 
+@functools.cache
+def load_test_file(file_path: Path) -> tuple[str, ast.Module]:
+    """
+    Read and parse a test file.
+
+    The result is cached so each test file is only read and parsed once per run, even though both `get_sections` and
+    `parse_test_file` need it.
+    """
+    content = file_path.read_text()
+    return content, ast.parse(content)
+
+
 # Define the sections to extract from the test files
 def get_sections():
     """Get sections from test files in the tests directory."""
     sections = {}
     for test_file in sorted(TESTS_DIR.glob("test_*.py")):
-        module = ast.parse(test_file.read_text())
+        _, module = load_test_file(test_file)
 
         docstring = ast.get_docstring(module)
         if docstring:
@@ -78,7 +112,7 @@ def extract_docstring(node: ast.AST) -> str | None:
     return None
 
 
-def extract_test_method_info(node: ast.FunctionDef, file_content: str) -> dict:
+def extract_test_method_info(node: ast.FunctionDef, file_lines: list[str]) -> dict:
     """Extract information from a test method."""
     docstring = extract_docstring(node)
 
@@ -95,27 +129,38 @@ def extract_test_method_info(node: ast.FunctionDef, file_content: str) -> dict:
     if end_lineno == 0:
         end_lineno = start_lineno + len(node.body) + 5  # Add some buffer
 
-    # Extract the method source code from the file content
-    file_lines = file_content.splitlines()
-    method_source = "\n".join(file_lines[start_lineno - 1 : end_lineno])
+    # The example code starts after the docstring, or after the def line if the method doesn't have one. The source
+    # lines are used instead of `ast.unparse` so the comments are kept.
+    first_item = node.body[0]
+    if (
+        isinstance(first_item, ast.Expr)
+        and isinstance(first_item.value, ast.Constant)
+        and isinstance(first_item.value.value, str)
+    ):
+        example_start_lineno = first_item.end_lineno + 1
+    else:
+        example_start_lineno = start_lineno + 1
+
+    # Extract the example source code from the file lines
+    example_code = "\n".join(file_lines[example_start_lineno - 1 : end_lineno])
 
     return {
         "name": node.name,
         "docstring": docstring,
-        "source_code": method_source,
+        "example_code": example_code,
         "start_line": start_lineno,
         "end_line": end_lineno,
     }
 
 
-def extract_test_class_info(node: ast.ClassDef, file_content: str) -> dict:
+def extract_test_class_info(node: ast.ClassDef, file_lines: list[str]) -> dict:
     """Extract information from a test class."""
     docstring = extract_docstring(node)
     methods = []
 
     for item in node.body:
         if isinstance(item, ast.FunctionDef) and item.name.startswith("test_"):
-            methods.append(extract_test_method_info(item, file_content))
+            methods.append(extract_test_method_info(item, file_lines))
 
     return {
         "name": node.name,
@@ -124,150 +169,115 @@ def extract_test_class_info(node: ast.ClassDef, file_content: str) -> dict:
     }
 
 
+@functools.cache
 def parse_test_file(file_path: Path) -> list[dict]:
     """Parse a test file and extract test classes and methods."""
-    with open(file_path, "r") as f:
-        content = f.read()
-
-    tree = ast.parse(content)
+    content, tree = load_test_file(file_path)
+    file_lines = content.splitlines()
     classes = []
 
-    for node in ast.walk(tree):
+    # Test classes are always defined at the top level of the module, so there's no need to walk the whole tree
+    for node in tree.body:
         if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
-            classes.append(extract_test_class_info(node, content))
+            classes.append(extract_test_class_info(node, file_lines))
 
     return classes
 
 
-def extract_comments_from_file(file_path: Path) -> dict[int, str]:
-    """Extract comments from a file, indexed by line number."""
-    with open(file_path, "r") as f:
-        lines = f.readlines()
-
-    comments = {}
-    current_comment = []
-    current_comment_start = None
-
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if line.startswith("#"):
-            if current_comment_start is None:
-                current_comment_start = i + 1
-            current_comment.append(line[1:].strip())
-        elif current_comment:
-            # End of a comment block
-            comments[current_comment_start] = "\n# ".join(current_comment)
-            current_comment = []
-            current_comment_start = None
-
-    # Handle case where file ends with a comment
-    if current_comment:
-        comments[current_comment_start] = "\n# ".join(current_comment)
-
-    return comments
-
-
-def clean_test_method_code(method_source: str) -> str:
-    """Clean up a test method for better readability in the README."""
-    # Remove the method definition line (def test_...)
-    lines = method_source.splitlines()
-    if lines and lines[0].strip().startswith("def test_"):
-        lines = lines[1:]
-
-    # Remove docstring if present
-    if len(lines) >= 2 and (
-        lines[0].strip().startswith('"""') or lines[0].strip().startswith("'''")
-    ):
-        # Find the end of the docstring
-        docstring_delimiter = '"""' if lines[0].strip().startswith('"""') else "'''"
-        docstring_end_idx = None
-
-        # Handle single-line docstrings
-        if docstring_delimiter in lines[0][lines[0].find(docstring_delimiter) + 3 :]:
-            docstring_end_idx = 0
-        else:
-            # Multi-line docstring
-            for i, line in enumerate(lines[1:], 1):
-                if docstring_delimiter in line:
-                    docstring_end_idx = i
-                    break
-
-        if docstring_end_idx is not None:
-            lines = lines[docstring_end_idx + 1 :]
-
+def clean_test_method_code(example_code: str) -> str:
+    """Clean up a test method's example code for better readability in the README."""
     # Fix indentation (remove the method indentation)
-    if lines:
-        # Find the minimum indentation level
-        min_indent = float("inf")
-        for line in lines:
-            if line.strip():  # Skip empty lines
-                indent = len(line) - len(line.lstrip())
-                min_indent = min(min_indent, indent)
-
-        # Remove the common indentation
-        if min_indent < float("inf"):
-            lines = [line[min_indent:] if line.strip() else line for line in lines]
+    code = textwrap.dedent(example_code)
 
     # Clean up self.render_str_template calls
-    code = "\n".join(lines)
-    code = re.sub(
-        r"self\.render_str_template\((.*?), (.*?)\)",
-        r"render_template(\1, \2)",
-        code,
-    )
+    code = RENDER_STR_TEMPLATE_PATTERN.sub(r"render_template(\1, \2)", code)
+
+    return code.strip()
+
+
+def format_code_examples(examples: list[str]) -> list[str]:
+    """
+    Format code examples using ruff.
+
+    The examples are joined into a single file, separated by a marker comment, so ruff only has to be run once instead
+    of once per example.
+    """
+    if not examples:
+        return []
+
+    code = f"\n\n{EXAMPLE_SEPARATOR}\n\n".join(examples)
 
-    # Format the code using ruff
     try:
-        # Create a temporary file with the code
-        with tempfile.NamedTemporaryFile(
-            mode="w+", suffix=".py", delete=False
-        ) as temp_file:
-            temp_file.write(code)
-            temp_file_path = temp_file.name
-
-        # Run ruff format on the temporary file
-        subprocess.run(
+        # Run ruff format on the code, passing it through stdin and reading the result from stdout
+        result = subprocess.run(
             [
-                "bash",
-                "-c",
-                f"cd {ROOT_DIR} && source .venv/bin/activate && ruff format {temp_file_path} --line-length 88",
+                RUFF_BIN,
+                "format",
+                "--stdin-filename",
+                "examples.py",
+                "--line-length",
+                "88",
             ],
+            input=code,
             check=True,
             capture_output=True,
+            text=True,
         )
+        formatted_code = result.stdout
 
-        # Read the formatted code
-        with open(temp_file_path, "r") as temp_file:
-            formatted_code = temp_file.read()
-
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
+        formatted_examples = formatted_code.split(EXAMPLE_SEPARATOR)
+        if len(formatted_examples) != len(examples):
+            raise ValueError("ruff changed the example separators")
 
-        return formatted_code.strip()
+        return [example.strip() for example in formatted_examples]
     except Exception as e:
         print(f"Error formatting code with ruff: {e}")
         # If there's an error, return the original code
-        return code.strip()
+        return [example.strip() for example in examples]
+
+
+def get_code_examples(sections: dict) -> dict[tuple[str, str, str], str]:
+    """
+    Get the cleaned up and formatted code examples for all the sections.
+
+    Returns a dictionary mapping (file, class name, method name) to the code example for each documented test method.
+    """
+    keys = []
+    examples = []
+    for section_info in sections.values():
+        for cls in parse_test_file(TESTS_DIR / section_info["file"]):
+            for method in cls["methods"]:
+                if method["docstring"]:
+                    keys.append((section_info["file"], cls["name"], method["name"]))
+                    examples.append(clean_test_method_code(method["example_code"]))
+
+    return dict(zip(keys, format_code_examples(examples)))
 
 
 def generate_markdown_for_section(
-    section_key: str, section_info: dict, github_repo_url=None
+    section_key: str, section_info: dict, code_examples: dict, github_repo_url=None
 ) -> str:
     """Generate markdown content for a section."""
     file_path = TESTS_DIR / section_info["file"]
     classes = parse_test_file(file_path)
 
-    markdown = f"## {section_info['title']}\n\n"
-    markdown += f"{section_info['description']}\n\n"
+    markdown = [
+        f"## {section_info['title']}\n\n",
+        f"{section_info['description']}\n\n",
+    ]
 
     for cls in classes:
         for method in cls["methods"]:
             if method["docstring"]:
-                markdown += f"### {method['name'].replace('test_', '').replace('_', ' ').title()}\n\n"
-                markdown += f"{method['docstring']}\n\n"
+                markdown.append(
+                    f"### {method['name'].replace('test_', '').replace('_', ' ').title()}\n\n"
+                )
+                markdown.append(f"{method['docstring']}\n\n")
 
                 # Add the entire method as a code example
-                cleaned_code = clean_test_method_code(method["source_code"])
+                cleaned_code = code_examples[
+                    (section_info["file"], cls["name"], method["name"])
+                ]
                 if cleaned_code:
                     # Add a right-aligned link to the full test file if GitHub URL is configured
                     if github_repo_url:
@@ -279,32 +289,29 @@ def generate_markdown_for_section(
                         file_link = f"{github_repo_url}/tests/{test_file_name}#L{start_line}-L{end_line}"
 
                         # Add a right-aligned link with an icon and better styling
-                        markdown += (
+                        markdown.append(
                             '<div align="right" style="margin-bottom: -10px;">'
                             f'<a href="{file_link}" title="View full example in source code" '
                             'style="font-size: 0.8em; color: #5a5a5a; text-decoration: none;">'
                             "📝 View full example</a></div>\n\n"
                         )
 
-                    markdown += "```python\n"
-                    markdown += cleaned_code
-                    markdown += "\n```\n\n"
+                    markdown.append(f"```python\n{cleaned_code}\n```\n\n")
 
-    return markdown
+    return "".join(markdown)
 
 
 def generate_readme_content(github_repo_url=None):
     """Generate the content for the README.md file."""
-    content = ""
-
     # Add each section
     sections = get_sections()
-    for section_key, section_info in sections.items():
-        content += generate_markdown_for_section(
-            section_key, section_info, github_repo_url
+    code_examples = get_code_examples(sections)
+    return "".join(
+        generate_markdown_for_section(
+            section_key, section_info, code_examples, github_repo_url
         )
-
-    return content
+        for section_key, section_info in sections.items()
+    )
 
 
 def extract_headings_from_content(content: str) -> list[tuple[int, str, str]]:
@@ -318,19 +325,15 @@ def extract_headings_from_content(content: str) -> list[tuple[int, str, str]]:
     """
     headings = []
 
-    # Regular expression to match Markdown headings
-    heading_pattern = re.compile(r"^(#{1,6})\s+(.+?)(?:\s+#{1,6})?$", re.MULTILINE)
-
-    for match in heading_pattern.finditer(content):
+    for match in HEADING_PATTERN.finditer(content):
         level = len(match.group(1))
         text = match.group(2).strip()
 
         # Create GitHub-style anchor: lowercase, replace spaces with hyphens, remove non-alphanumeric chars
         anchor = text.lower()
-        anchor = re.sub(
-            r"[^\w\- ]", "", anchor
-        )  # Remove non-alphanumeric chars except spaces and hyphens
-        anchor = re.sub(r"\s+", "-", anchor)  # Replace spaces with hyphens
+        # Remove non-alphanumeric chars except spaces and hyphens
+        anchor = ANCHOR_INVALID_CHARS_PATTERN.sub("", anchor)
+        anchor = WHITESPACE_PATTERN.sub("-", anchor)  # Replace spaces with hyphens
 
         headings.append((level, text, anchor))
 
@@ -341,7 +344,7 @@ def generate_table_of_contents(content: str) -> str:
     """Generate a table of contents from the content."""
     headings = extract_headings_from_content(content)
 
-    toc = "## Table of Contents\n\n"
+    toc = ["## Table of Contents\n\n"]
 
     for level, text, anchor in headings:
         # Skip H1 headings (usually the title) and the TOC itself
@@ -350,9 +353,9 @@ def generate_table_of_contents(content: str) -> str:
 
         # Add indentation based on heading level
         indent = "  " * (level - 2)
-        toc += f"{indent}- [{text}](#{anchor})\n"
+        toc.append(f"{indent}- [{text}](#{anchor})\n")
 
-    return toc
+    return "".join(toc)
 
 
 def update_readme(github_repo_url=None):
@@ -409,6 +412,11 @@ def update_readme(github_repo_url=None):
             + new_content[toc_end_index:]
         )
 
+    # Leave the file alone if nothing changed, so its modification time isn't bumped
+    if new_content == current_content:
+        print("README.md is already up to date.")
+        return
+
     # Write the updated content back to the file
     README_PATH.write_text(new_content)
 
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""
+Script to generate the static list of IANA timezone names.
+
+`zoneinfo.available_timezones()` walks the whole zoneinfo search path every time it's called. Since the list of zones
+only changes when the tz database is upgraded, this script snapshots it into `apps/base/timezone_names.py` so the
+`TimeZoneField` choices can be built without touching the filesystem.
+
+The script is meant to be run against the system tz database on Linux or macOS. `uv.lock` only installs the `tzdata`
+package on Windows, which has no system database, and when it's installed it takes precedence. Since the list depends
+on the tz release of whichever source is used, re-run this script after upgrading the system tz database and commit
+the result.
+
+Usage:
+    python scripts/update_timezones.py
+"""
+
+import zoneinfo
+from importlib import resources
+from pathlib import Path
+
+# Define the root directory of the project
+ROOT_DIR = Path(__file__).parent.parent
+TIMEZONE_NAMES_PATH = ROOT_DIR / "apps" / "base" / "timezone_names.py"
+
+
+def get_timezone_names() -> list[str]:
+    """
+    Get the sorted list of timezone names.
+
+    If the `tzdata` package is installed, the names are read from its `zones` file, which lists every IANA zone in a
+    single resource. Otherwise, the system tz database is scanned with `zoneinfo.available_timezones()`, minus the
+    host-specific `localtime` link that some systems include.
+    """
+    try:
+        zones = resources.files("tzdata").joinpath("zones").read_text()
+    except ModuleNotFoundError:
+        names = zoneinfo.available_timezones() - {"localtime"}
+    else:
+        names = {line.strip() for line in zones.splitlines() if line.strip()}
+    return sorted(names)
+
+
+def generate_module_content(names: list[str]) -> str:
+    """Generate the content for the timezone names module."""
+    lines = [
+        "# This file is generated by scripts/update_timezones.py. Don't edit it by hand.",
+        "",
+        "TIMEZONE_NAMES = (",
+    ]
+    lines.extend(f'    "{name}",' for name in names)
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def update_timezone_names():
+    """Update the timezone names module with the zones available on this system."""
+    names = get_timezone_names()
+    TIMEZONE_NAMES_PATH.write_text(generate_module_content(names))
+    print(
+        f"Updated {TIMEZONE_NAMES_PATH.relative_to(ROOT_DIR)} with {len(names)} timezones."
+    )
+
+
+if __name__ == "__main__":
+    update_timezone_names()
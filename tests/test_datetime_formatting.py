@@ -1,17 +1,21 @@
 """
 Formatting datetime objects in Django
+
+The examples in this section format `utc_dt`, a fixed datetime in UTC for demonstration purposes, which is created with
+`datetime(2024, 10, 1, 13, 30, tzinfo=utc)`.
 """
 
 from datetime import datetime, timezone
 
 from django.conf import settings
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.utils import timezone as dj_tz, formats
 
 utc = timezone.utc
+utc_dt = datetime(2024, 10, 1, 13, 30, tzinfo=utc)
 
 
-class TestDateTimeFormatting(TestCase):
+class TestDateTimeFormatting(SimpleTestCase):
     def test_datetime_string_formats(self):
         """
         Django provides several ways to format datetime objects into strings.
@@ -20,9 +24,6 @@ class TestDateTimeFormatting(TestCase):
         **Note:** The format function **DOESN'T** automatically convert datetime objects
         that are in UTC to the current timezone.
         """
-        # Create a fixed datetime in UTC for demonstration purposes
-        utc_dt = datetime(2024, 10, 1, 13, 30, tzinfo=utc)
-
         assert (
             formats.date_format(utc_dt, settings.DATETIME_FORMAT)
             == "Oct. 1, 2024, 1:30 p.m."
@@ -46,9 +47,6 @@ class TestDateTimeFormatting(TestCase):
                 timezone = dj_tz.get_default_timezone()
             return formats.date_format(dj_tz.localtime(dt, timezone=timezone), df)
 
-        # Create a fixed datetime in UTC for demonstration purposes
-        utc_dt = datetime(2024, 10, 1, 13, 30, tzinfo=utc)
-
         assert local_datetime_format(utc_dt) == "Oct. 1, 2024, 8:30 a.m."
         assert (
             local_datetime_format(utc_dt, settings.DATETIME_FORMAT)
@@ -69,8 +67,6 @@ class TestDateTimeFormatting(TestCase):
         Then everywhere you need to format a datetime in the `SHORT_DATETIME_FORMAT` string in the local timezone, you
         can call this function.
         """
-        # Create a fixed datetime in UTC for demonstration purposes
-        utc_dt = datetime(2024, 10, 1, 13, 30, tzinfo=utc)
 
         # Create even shorter functions
         def local_short_datetime_format(dt, timezone=None):
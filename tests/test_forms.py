@@ -1,7 +1,11 @@
 """
 Working with datetime fields in forms
+
+The examples in this section use `EventForm`, the `ModelForm` for the `Event` model defined in `tests/test_forms.py`.
+`los_angeles_tz` and `new_york_tz` are `ZoneInfo` objects for their respective timezones.
 """
 
+import functools
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
@@ -14,12 +18,25 @@ from apps.events.models import Event
 from model_bakery import baker
 
 utc = timezone.utc
+los_angeles_tz = ZoneInfo("America/Los_Angeles")
+new_york_tz = ZoneInfo("America/New_York")
+
+
+@functools.lru_cache(maxsize=128)
+def get_template(template_str):
+    return Template(template_str)
+
+
+class EventForm(forms.ModelForm):
+    class Meta:
+        model = Event
+        fields = "__all__"
 
 
 class TestForms(TestCase):
     @staticmethod
     def render_str_template(template_str, context):
-        template = Template(template_str)
+        template = get_template(template_str)
         context = Context(context)
         return template.render(context).strip()
 
@@ -30,20 +47,15 @@ class TestForms(TestCase):
         you can ensure that the form validates the data in the correct timezone.
         """
         # Use override to temporarily save a model's datetime in a different timezone
-        with dj_tz.override(ZoneInfo("America/Los_Angeles")):
+        with dj_tz.override(los_angeles_tz):
             event_start_time = dj_tz.make_aware(datetime(2024, 1, 1, 22, 30))
             event_end_time = event_start_time + timedelta(hours=1)
-            event = baker.make("events.Event")
-            event.start_time = event_start_time
-            event.end_time = event_end_time
-            event.save()
+            event = baker.make(
+                "events.Event", start_time=event_start_time, end_time=event_end_time
+            )
 
         # Test overriding the timezone with in a ModelForm
-        class EventForm(forms.ModelForm):
-            class Meta:
-                model = Event
-                fields = "__all__"
-
+        class TimezoneEventForm(EventForm):
             def is_valid(self):
                 with dj_tz.override(ZoneInfo(self.data["timezone"])):
                     return super().is_valid()
@@ -54,13 +66,12 @@ class TestForms(TestCase):
             "end_time": formats.date_format(event_end_time, "m/d/Y H:i:s"),
             "timezone": "America/New_York",
         }
-        form = EventForm(instance=event, data=data)
-        assert form.is_valid() is True
-        form.save()
-        event.refresh_from_db()
+        form = TimezoneEventForm(instance=event, data=data)
+        assert form.is_valid()
+        event = form.save()
         assert dj_tz.localtime(
-            event.start_time, ZoneInfo("America/New_York")
-        ) == event_start_time.replace(tzinfo=ZoneInfo("America/New_York"))
+            event.start_time, new_york_tz
+        ) == event_start_time.replace(tzinfo=new_york_tz)
 
     def test_form_rendering(self):
         """
@@ -74,14 +85,7 @@ class TestForms(TestCase):
 
         # Create a start and end time in a different timezone. Let's use 5:00 PM in PST because it will be the next day
         # in UTC which is a good test case.
-        local_tz = ZoneInfo("America/Los_Angeles")
-        start_time = datetime(2025, 2, 20, 17, 00, tzinfo=local_tz)
-
-        # Create a form with a datetime field
-        class EventForm(forms.ModelForm):
-            class Meta:
-                model = Event
-                fields = "__all__"
+        start_time = datetime(2025, 2, 20, 17, 00, tzinfo=los_angeles_tz)
 
         # Create an event with the start and end time in the local timezone.
         event = baker.make(
@@ -91,7 +95,7 @@ class TestForms(TestCase):
             start_time=start_time,
             end_time=start_time + timedelta(hours=1),
         )
-        event.refresh_from_db()
+        event.refresh_from_db(fields=["start_time", "end_time"])
 
         # Assert that the event is converted to UTC correctly
         assert event.start_time == datetime(2025, 2, 21, 1, 0, tzinfo=utc)
@@ -111,24 +115,17 @@ class TestForms(TestCase):
         # Instead if you want to render the datetime fields in the model's timezone, you can override the initial values
         # in the form.
 
-        # Create a form with a datetime field
-        class LocalEventTimeForm(forms.ModelForm):
-            class Meta:
-                model = Event
-                fields = "__all__"
-
+        # Create a form that renders the datetime fields in the event's timezone
+        class LocalEventTimeForm(EventForm):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, **kwargs)
                 if self.instance is not None:
+                    event_tz = ZoneInfo(self.instance.timezone)
                     self.initial["start_time"] = formats.localize_input(
-                        dj_tz.localtime(
-                            event.start_time, ZoneInfo(self.instance.timezone)
-                        )
+                        dj_tz.localtime(self.instance.start_time, event_tz)
                     )
                     self.initial["end_time"] = formats.localize_input(
-                        dj_tz.localtime(
-                            event.end_time, ZoneInfo(self.instance.timezone)
-                        )
+                        dj_tz.localtime(self.instance.end_time, event_tz)
                     )
 
         # Initialize a form with the event
@@ -5,13 +5,13 @@ Mocking datetime operations in Django Tests
 from datetime import datetime, timezone
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.utils import timezone as dj_tz
 
 utc = timezone.utc
 
 
-class TestMocking(TestCase):
+class TestMocking(SimpleTestCase):
     @patch("django.utils.timezone.now")
     def test_mocking_datetime(self, mock_now):
         """
@@ -2,13 +2,11 @@
 Working with Date Times in Models
 """
 
-import json
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
-from django.core.serializers import serialize
+from django.db.models import F
 from django.test import TestCase
-from django.utils import timezone as dj_tz
 
 from apps.events.models import Event
 
@@ -16,11 +14,17 @@ utc = timezone.utc
 
 
 class TestModels(TestCase):
-    def test_bulk_create_and_bulk_update(self):
+    def test_bulk_create_and_update(self):
         """
         When creating multiple model instances with datetime fields in bulk,
         it's important to ensure that the datetimes are stored correctly in the database.
-        This test demonstrates how to create events in different timezones using bulk_create.
+        This test demonstrates how to create events in different timezones using bulk_create. With `ZoneInfo`
+        timezones, `replace(tzinfo=...)` is equivalent to `make_aware`, which only adds a check that the datetime is
+        naive.
+
+        It then shifts all the events by the same amount using `update()` with `F()` expressions, which does the math
+        in a single `UPDATE` query without loading the events into Python. If each event needs a different value, use
+        `bulk_update()` instead.
         """
         naive_start_time = datetime(2025, 2, 20, 16, 20)
         naive_end_time = naive_start_time + timedelta(hours=1)
@@ -33,135 +37,92 @@ class TestModels(TestCase):
 
         events = []
         for time_zone in time_zones_to_test:
-            tz_obj = ZoneInfo(time_zone)
+            tz = ZoneInfo(time_zone)
             events.append(
                 Event(
-                    **{
-                        "name": time_zone,
-                        "start_time": dj_tz.make_aware(
-                            naive_start_time, timezone=tz_obj
-                        ),
-                        "end_time": dj_tz.make_aware(naive_end_time, timezone=tz_obj),
-                        "timezone": time_zone,
-                    }
+                    name=time_zone,
+                    start_time=naive_start_time.replace(tzinfo=tz),
+                    end_time=naive_end_time.replace(tzinfo=tz),
+                    timezone=time_zone,
                 )
             )
 
         Event.objects.bulk_create(events)
 
         # Assert that events are in the correct time UTC time according to their timezone
-        serialized_events = [
-            {"id": obj["pk"], **obj["fields"]}  # Flatten by merging pk and fields
-            for obj in json.loads(serialize("json", Event.objects.all()))
-        ]
-        assert serialized_events == [
+        assert list(
+            Event.objects.order_by("id").values(
+                "id", "name", "start_time", "end_time", "timezone"
+            )
+        ) == [
             {
-                "end_time": "2025-02-21T01:20:00Z",
                 "id": 1,
                 "name": "America/Los_Angeles",
-                "start_time": "2025-02-21T00:20:00Z",
+                "start_time": datetime(2025, 2, 21, 0, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 21, 1, 20, tzinfo=utc),
                 "timezone": "America/Los_Angeles",
             },
             {
-                "end_time": "2025-02-21T00:20:00Z",
                 "id": 2,
                 "name": "America/Denver",
-                "start_time": "2025-02-20T23:20:00Z",
+                "start_time": datetime(2025, 2, 20, 23, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 21, 0, 20, tzinfo=utc),
                 "timezone": "America/Denver",
             },
             {
-                "end_time": "2025-02-20T23:20:00Z",
                 "id": 3,
                 "name": "America/Chicago",
-                "start_time": "2025-02-20T22:20:00Z",
+                "start_time": datetime(2025, 2, 20, 22, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 20, 23, 20, tzinfo=utc),
                 "timezone": "America/Chicago",
             },
             {
-                "end_time": "2025-02-20T22:20:00Z",
                 "id": 4,
                 "name": "America/New_York",
-                "start_time": "2025-02-20T21:20:00Z",
+                "start_time": datetime(2025, 2, 20, 21, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 20, 22, 20, tzinfo=utc),
                 "timezone": "America/New_York",
             },
         ]
 
-    def test_bulk_update(self):
-        """
-        Handle datetime fields in bulk update operations.
-
-        When updating multiple model instances with datetime fields in bulk,
-        it's important to ensure that the datetimes are updated correctly in the database.
-        This test demonstrates how to update events in different timezones using bulk_update.
-        """
-        # First create the events
-        naive_start_time = datetime(2025, 2, 20, 16, 20)
-        naive_end_time = naive_start_time + timedelta(hours=1)
-        time_zones_to_test = [
-            "America/Los_Angeles",
-            "America/Denver",
-            "America/Chicago",
-            "America/New_York",
-        ]
-
-        events = []
-        for time_zone in time_zones_to_test:
-            tz_obj = ZoneInfo(time_zone)
-            events.append(
-                Event(
-                    **{
-                        "name": time_zone,
-                        "start_time": dj_tz.make_aware(
-                            naive_start_time, timezone=tz_obj
-                        ),
-                        "end_time": dj_tz.make_aware(naive_end_time, timezone=tz_obj),
-                        "timezone": time_zone,
-                    }
-                )
-            )
-
-        Event.objects.bulk_create(events)
-
-        # Test bulk update by adding 1 hour to the start and end time
-        events_to_update = []
-        for event in Event.objects.all():
-            event.start_time += timedelta(hours=1)
-            event.end_time += timedelta(hours=1)
-            events_to_update.append(event)
-
-        Event.objects.bulk_update(events_to_update, ["start_time", "end_time"])
+        # Add 1 hour to every event's start and end time with a single queryset update() using F() expressions
+        Event.objects.update(
+            start_time=F("start_time") + timedelta(hours=1),
+            end_time=F("end_time") + timedelta(hours=1),
+        )
 
         # Assert that events have been updated by one hour and are in the correct time UTC time according to their timezone
-        serialized_events = [
-            {"id": obj["pk"], **obj["fields"]}  # Flatten by merging pk and fields
-            for obj in json.loads(serialize("json", Event.objects.all()))
-        ]
-        assert serialized_events == [
+        assert list(
+            Event.objects.order_by("id").values(
+                "id", "name", "start_time", "end_time", "timezone"
+            )
+        ) == [
             {
-                "end_time": "2025-02-21T02:20:00Z",
                 "id": 1,
                 "name": "America/Los_Angeles",
-                "start_time": "2025-02-21T01:20:00Z",
+                "start_time": datetime(2025, 2, 21, 1, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 21, 2, 20, tzinfo=utc),
                 "timezone": "America/Los_Angeles",
             },
             {
-                "end_time": "2025-02-21T01:20:00Z",
                 "id": 2,
                 "name": "America/Denver",
-                "start_time": "2025-02-21T00:20:00Z",
+                "start_time": datetime(2025, 2, 21, 0, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 21, 1, 20, tzinfo=utc),
                 "timezone": "America/Denver",
             },
             {
-                "end_time": "2025-02-21T00:20:00Z",
                 "id": 3,
                 "name": "America/Chicago",
-                "start_time": "2025-02-20T23:20:00Z",
+                "start_time": datetime(2025, 2, 20, 23, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 21, 0, 20, tzinfo=utc),
                 "timezone": "America/Chicago",
             },
             {
-                "end_time": "2025-02-20T23:20:00Z",
                 "id": 4,
                 "name": "America/New_York",
-                "start_time": "2025-02-20T22:20:00Z",
+                "start_time": datetime(2025, 2, 20, 22, 20, tzinfo=utc),
+                "end_time": datetime(2025, 2, 20, 23, 20, tzinfo=utc),
                 "timezone": "America/New_York",
             },
         ]
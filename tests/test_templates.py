@@ -1,7 +1,12 @@
 """
 Datetime Template rendering in Django
+
+The examples in this section use `utc_dt`, a fixed datetime in UTC for demonstration purposes, which is created with
+`datetime(2024, 1, 2, 0, 0, tzinfo=utc)`. In UTC it's January 2nd, but in the local CST timezone it's still January 1st.
+`los_angeles_tz` is a `ZoneInfo` object for the `"America/Los_Angeles"` timezone.
 """
 
+import functools
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 
@@ -9,15 +14,22 @@ from django.template import Template, Context
 from django.test import TestCase
 from django.utils import timezone as dj_tz
 
-from model_bakery import baker
+from apps.events.models import Event
 
 utc = timezone.utc
+utc_dt = datetime(2024, 1, 2, 0, 0, tzinfo=utc)
+los_angeles_tz = ZoneInfo("America/Los_Angeles")
+
+
+@functools.lru_cache(maxsize=128)
+def get_template(template_str):
+    return Template(template_str)
 
 
 class TestTemplateRendering(TestCase):
     @staticmethod
     def render_str_template(template_str, context):
-        template = Template(template_str)
+        template = get_template(template_str)
         context = Context(context)
         return template.render(context).strip()
 
@@ -28,10 +40,6 @@ class TestTemplateRendering(TestCase):
 
         The `date` filter can be used to format datetime objects in different ways.
         """
-        # Create a fixed datetime in UTC for demonstration purposes.  When in UTC, this datetime
-        # has a different day (the 2nd) than it does in the local CST timezone (where it would be the 1st).
-        utc_dt = datetime(2024, 1, 2, 0, 0, tzinfo=utc)
-
         # Render a datetime object using Django's default formatting for Django templates which is
         # the `settings.DATETIME_FORMAT`.
         result = self.render_str_template("{{ utc_dt }}", {"utc_dt": utc_dt})
@@ -68,9 +76,6 @@ class TestTemplateRendering(TestCase):
         in a way that JavaScript can understand. The 'c' format specifier outputs
         an ISO 8601 formatted date, which is ideal for JavaScript.
         """
-        # Create a fixed datetime in UTC for demonstration purposes
-        utc_dt = datetime(2024, 1, 2, 0, 0, tzinfo=utc)
-
         # Render a datetime object in order to pass it into Javascript
         result = self.render_str_template(
             """
@@ -91,11 +96,8 @@ class TestTemplateRendering(TestCase):
         Django provides template tags to control timezone conversion in templates.
         The `timezone` tag allows you to render a datetime in a specific timezone.
         """
-        # Create a fixed datetime in UTC for demonstration purposes
-        utc_dt = datetime(2024, 1, 2, 0, 0, tzinfo=utc)
-
         # Render a datetime object that has a different timezone than the active timezone
-        pt_dt = dj_tz.localtime(utc_dt, ZoneInfo("America/Los_Angeles"))
+        pt_dt = dj_tz.localtime(utc_dt, los_angeles_tz)
         assert pt_dt.strftime("%Y-%m-%d %-I:%M %p") == "2024-01-01 4:00 PM"
         assert dj_tz.get_current_timezone_name() == "America/Chicago"
         result = self.render_str_template("{{ pt_dt }}", {"pt_dt": pt_dt})
@@ -117,16 +119,16 @@ class TestTemplateRendering(TestCase):
         model's timezone rather than the current timezone.
         """
         # Render a datetime object in a different timezone using the localtime template tag.
-        p_dt = datetime(2024, 1, 1, 13, 30, tzinfo=ZoneInfo("America/Los_Angeles"))
-        event = baker.make(
-            "events.event",
+        p_dt = datetime(2024, 1, 1, 13, 30, tzinfo=los_angeles_tz)
+        event = Event.objects.create(
+            name="Event Test",
             start_time=p_dt,
             end_time=p_dt + timedelta(hours=1),
             timezone="America/Los_Angeles",
         )
-        event.refresh_from_db()
+        event.refresh_from_db(fields=["start_time"])
         assert event.start_time.tzinfo == utc
-        assert p_dt.tzinfo == ZoneInfo("America/Los_Angeles")
+        assert p_dt.tzinfo == los_angeles_tz
 
         # The following template will use the model's display_start_time method to render the start time. The method
         # converts the start_time to the model's timezone using the timezone field and then makes it naive, so that